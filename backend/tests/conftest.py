@@ -0,0 +1,20 @@
+"""
+Shared pytest configuration for the backend test suite
+"""
+import sys
+from unittest.mock import MagicMock
+
+# Every test mocks out VectorStore, so don't pay for importing chromadb and
+# sentence-transformers (which drags in torch) in each xdist worker.
+# WARNING: this means nothing under backend/tests can exercise real chromadb;
+# a test using a real VectorStore would silently run against these MagicMocks.
+for _module in ("chromadb", "chromadb.config", "sentence_transformers"):
+    sys.modules.setdefault(_module, MagicMock())
+
+
+def pytest_configure(config):
+    """Show the tests' debug logging live for serial (-n0) runs with -v"""
+    # xdist workers never forward live logs, so only enable it without them
+    serial = not getattr(config.option, "numprocesses", None)
+    if serial and config.option.verbose > 0 and config.option.log_cli_level is None:
+        config.option.log_cli_level = "DEBUG"
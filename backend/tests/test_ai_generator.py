@@ -1,12 +1,47 @@
 """
 Tests for AIGenerator tool calling functionality
 """
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import logging
+import pytest
+from dataclasses import dataclass, field
+from unittest.mock import Mock, patch
 
-from unittest.mock import Mock, MagicMock, patch
-from ai_generator import AIGenerator
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class FakeBlock:
+    """Plain stand-in for an Anthropic content block"""
+    type: str = "text"
+    text: str = ""
+    name: str = ""
+    id: str = ""
+    input: dict = field(default_factory=dict)
+
+
+@dataclass(frozen=True, slots=True)
+class FakeResponse:
+    """Plain stand-in for an Anthropic message response"""
+    stop_reason: str
+    content: list
+
+
+# The Anthropic client is mocked, so these never reach the API
+_API_KEY = "test-api-key"
+_MODEL = "claude-sonnet-4-20250514"
+
+# Tool schema served by MockToolManager; built once since it never changes
+_TOOL_DEFS = ({
+    "name": "search_course_content",
+    "description": "Search course content",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string"}
+        },
+        "required": ["query"]
+    }
+},)
 
 
 class MockToolManager:
@@ -19,62 +54,75 @@ class MockToolManager:
         return f"Mock result for {tool_name} with {kwargs}"
 
     def get_tool_definitions(self):
-        return [{
-            "name": "search_course_content",
-            "description": "Search course content",
-            "input_schema": {
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string"}
-                },
-                "required": ["query"]
-            }
-        }]
+        return _TOOL_DEFS
 
 
-class TestAIGeneratorToolCalling:
-    """Test AIGenerator correctly calls tools"""
+def _make_client(responses=()):
+    """Build a mock Anthropic client that returns the given responses in order"""
+    import anthropic
+    client = Mock(spec=anthropic.Anthropic)
+    client.messages.create.side_effect = list(responses)
+    return client
 
-    def setup_method(self):
-        """Set up test fixtures"""
-        # We'll mock the Anthropic client
-        self.api_key = "test-api-key"
-        self.model = "claude-sonnet-4-20250514"
 
-    @patch('ai_generator.anthropic.Anthropic')
-    def test_ai_generator_detects_tool_use(self, mock_anthropic_class):
-        """Test that AIGenerator detects when Claude wants to use a tool"""
-        # Create mock client and response
-        mock_client = Mock()
-        mock_anthropic_class.return_value = mock_client
+@pytest.fixture(scope="class")
+def mock_client():
+    """Anthropic client shared by a test class, patched in once"""
+    client = _make_client()
+    with patch('ai_generator.anthropic.Anthropic', return_value=client):
+        yield client
+
+
+@pytest.fixture(scope="class")
+def ai_gen(mock_client):
+    """AIGenerator bound to the shared mock client"""
+    from ai_generator import AIGenerator
+    return AIGenerator(_API_KEY, _MODEL)
+
 
-        # Mock first response with tool use
-        mock_tool_block = Mock()
-        mock_tool_block.type = "tool_use"
-        mock_tool_block.name = "search_course_content"
-        mock_tool_block.id = "tool_123"
-        mock_tool_block.input = {"query": "What is RAG?"}
+@pytest.fixture(autouse=True)
+def reset_client(mock_client):
+    """Forget the previous test's calls and queued responses"""
+    mock_client.messages.create.reset_mock(side_effect=True)
 
-        mock_first_response = Mock()
-        mock_first_response.stop_reason = "tool_use"
-        mock_first_response.content = [mock_tool_block]
 
-        # Mock second response after tool execution
-        mock_text_block = Mock()
-        mock_text_block.text = "RAG stands for Retrieval-Augmented Generation"
+@pytest.fixture(scope="class")
+def tool_manager():
+    """MockToolManager shared by a test class"""
+    return MockToolManager()
 
-        mock_second_response = Mock()
-        mock_second_response.content = [mock_text_block]
+
+@pytest.fixture(autouse=True)
+def reset_tool_manager(tool_manager):
+    """Forget tools executed by the previous test"""
+    tool_manager.executed_tools.clear()
+
+
+class TestAIGeneratorToolCalling:
+    """Test AIGenerator correctly calls tools"""
+
+    def test_ai_generator_detects_tool_use(self, mock_client, ai_gen, tool_manager):
+        """Test that AIGenerator detects when Claude wants to use a tool"""
+        # Fake first response with tool use
+        tool_block = FakeBlock(
+            type="tool_use",
+            name="search_course_content",
+            id="tool_123",
+            input={"query": "What is RAG?"}
+        )
+        first_response = FakeResponse(stop_reason="tool_use", content=[tool_block])
+
+        # Fake second response after tool execution
+        second_response = FakeResponse(
+            stop_reason="end_turn",
+            content=[FakeBlock(text="RAG stands for Retrieval-Augmented Generation")]
+        )
 
         mock_client.messages.create.side_effect = [
-            mock_first_response,
-            mock_second_response
+            first_response,
+            second_response
         ]
 
-        # Create AI generator and tool manager
-        ai_gen = AIGenerator(self.api_key, self.model)
-        tool_manager = MockToolManager()
-
         # Make request
         result = ai_gen.generate_response(
             query="What is RAG?",
@@ -93,28 +141,19 @@ class TestAIGeneratorToolCalling:
         # Verify two API calls were made
         assert mock_client.messages.create.call_count == 2
 
-        print(f"✓ Test passed: AI generator detects and executes tool use")
-        print(f"  Tool executed: {tool_manager.executed_tools[0]}")
-        print(f"  Final response: {result}")
+        logger.debug("Test passed: AI generator detects and executes tool use")
+        logger.debug("  Tool executed: %s", tool_manager.executed_tools[0])
+        logger.debug("  Final response: %s", result)
 
-    @patch('ai_generator.anthropic.Anthropic')
-    def test_ai_generator_handles_direct_response(self, mock_anthropic_class):
+    def test_ai_generator_handles_direct_response(self, mock_client, ai_gen, tool_manager):
         """Test that AIGenerator handles responses without tool use"""
-        mock_client = Mock()
-        mock_anthropic_class.return_value = mock_client
-
-        # Mock direct text response (no tool use)
-        mock_text_block = Mock()
-        mock_text_block.text = "General knowledge answer"
-
-        mock_response = Mock()
-        mock_response.stop_reason = "end_turn"
-        mock_response.content = [mock_text_block]
-
-        mock_client.messages.create.return_value = mock_response
+        # Fake direct text response (no tool use)
+        response = FakeResponse(
+            stop_reason="end_turn",
+            content=[FakeBlock(text="General knowledge answer")]
+        )
 
-        ai_gen = AIGenerator(self.api_key, self.model)
-        tool_manager = MockToolManager()
+        mock_client.messages.create.side_effect = [response]
 
         result = ai_gen.generate_response(
             query="What is 2+2?",
@@ -131,70 +170,13 @@ class TestAIGeneratorToolCalling:
         # Verify only one API call was made
         assert mock_client.messages.create.call_count == 1
 
-        print(f"✓ Test passed: AI generator handles direct response")
-        print(f"  Response: {result}")
+        logger.debug("Test passed: AI generator handles direct response")
+        logger.debug("  Response: %s", result)
 
-    @patch('ai_generator.anthropic.Anthropic')
-    def test_system_prompt_includes_tool_instructions(self, mock_anthropic_class):
+    def test_system_prompt_includes_tool_instructions(self, ai_gen):
         """Test that system prompt mentions both tools"""
-        mock_client = Mock()
-        mock_anthropic_class.return_value = mock_client
-
-        mock_text_block = Mock()
-        mock_text_block.text = "Response"
-
-        mock_response = Mock()
-        mock_response.stop_reason = "end_turn"
-        mock_response.content = [mock_text_block]
-
-        mock_client.messages.create.return_value = mock_response
-
-        ai_gen = AIGenerator(self.api_key, self.model)
-
         # Check the static system prompt
         assert "search_course_content" in ai_gen.SYSTEM_PROMPT
         assert "get_course_outline" in ai_gen.SYSTEM_PROMPT
 
-        print(f"✓ Test passed: System prompt includes tool instructions")
-        print(f"  Prompt mentions search_course_content: {'search_course_content' in ai_gen.SYSTEM_PROMPT}")
-        print(f"  Prompt mentions get_course_outline: {'get_course_outline' in ai_gen.SYSTEM_PROMPT}")
-
-
-def run_tests():
-    """Run all tests and report results"""
-    print("\n" + "="*60)
-    print("TESTING: AIGenerator Tool Calling")
-    print("="*60 + "\n")
-
-    test_class = TestAIGeneratorToolCalling()
-    tests = [
-        test_class.test_ai_generator_detects_tool_use,
-        test_class.test_ai_generator_handles_direct_response,
-        test_class.test_system_prompt_includes_tool_instructions,
-    ]
-
-    passed = 0
-    failed = 0
-
-    for test in tests:
-        try:
-            test_class.setup_method()
-            test()
-            passed += 1
-        except Exception as e:
-            failed += 1
-            print(f"✗ Test failed: {test.__name__}")
-            print(f"  Error: {str(e)}")
-            import traceback
-            traceback.print_exc()
-
-    print(f"\n{'='*60}")
-    print(f"Results: {passed} passed, {failed} failed")
-    print(f"{'='*60}\n")
-
-    return failed == 0
-
-
-if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+        logger.debug("Test passed: System prompt includes tool instructions")
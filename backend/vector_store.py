@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from models import Course, CourseChunk
 from sentence_transformers import SentenceTransformer
 
-@dataclass
+@dataclass(slots=True)
 class SearchResults:
     """Container for search results with metadata"""
     documents: List[str]